@@ -23,10 +23,42 @@ SPANISH_EXCLUSIONS = r"uno|dos|tres|cuatro|cinco|seis|siete|ocho|nueve|diez|este
 SINGLE_MASK = "__DOT__"
 COMPOUND_MASK = "_DOT_"
 
+# Domain label characters, including accented letters (Unicode \u00C0-\u017F covers
+# Latin-1 Supplement and Latin Extended-A) for domains like sinónimosonline.com
+_DOMAIN_LABEL = r"[a-zA-Z0-9\u00C0-\u017F\-]+"
+_SUBDOMAIN_PREFIXES = r"www|ftp|mail|blog|shop|app|api|cdn|static|news|support|help|docs|admin|secure|login|m|mobile|store|sub|dev|test|staging|prod|beta|alpha"
+
+# Compiled once at import; mask_domains runs on every sentence
+_SPANISH_WORD_RE = re.compile(rf"^({SPANISH_EXCLUSIONS})$", re.IGNORECASE)
+_SUBDOMAIN_COMPOUND_RE = re.compile(
+    rf"\b((?:{_SUBDOMAIN_PREFIXES})\.)({_DOMAIN_LABEL})\.({COMPOUND_TLDS})\b", re.IGNORECASE
+)
+_COMPOUND_DOMAIN_RE = re.compile(rf"\b({_DOMAIN_LABEL})\.({COMPOUND_TLDS})\b", re.IGNORECASE)
+
+
+def _single_tlds_for_language(language: str | None) -> str:
+    """Return the single-TLD alternation, without .de/.es for Spanish text."""
+    # Exclude .de and .es TLDs for Spanish text since "de" and "es" are extremely common Spanish words
+    single_tlds = SINGLE_TLDS
+    if language and language.lower() == 'es':
+        single_tlds = single_tlds.replace('de|', '').replace('|de', '')
+        single_tlds = single_tlds.replace('es|', '').replace('|es', '')
+    return single_tlds
+
+
+# (subdomain single-TLD regex, single-TLD regex), keyed by whether the text is Spanish
+_SINGLE_TLD_RES = {
+    is_spanish: (
+        re.compile(rf"\b((?:{_SUBDOMAIN_PREFIXES})\.)({_DOMAIN_LABEL})\.({tlds})\b", re.IGNORECASE),
+        re.compile(rf"\b({_DOMAIN_LABEL})\.({tlds})\b", re.IGNORECASE),
+    )
+    for is_spanish, tlds in ((False, _single_tlds_for_language(None)), (True, _single_tlds_for_language('es')))
+}
+
 
 def _is_spanish_word(label: str) -> bool:
     """Check if a label is a common Spanish word that should not be treated as a domain."""
-    return bool(re.match(rf"^({SPANISH_EXCLUSIONS})$", label, re.IGNORECASE))
+    return bool(_SPANISH_WORD_RE.match(label))
 
 
 def mask_domains(text: str, use_exclusions: bool = True, language: str | None = None) -> str:
@@ -46,11 +78,7 @@ def mask_domains(text: str, use_exclusions: bool = True, language: str | None =
         "Visit www.google.com" -> "Visit www__DOT__google__DOT__com"
         "Necesita ser tratada.de hecho" -> "Necesita ser tratada.de hecho" (Spanish: .de/.es excluded)
     """
-    # Exclude .de and .es TLDs for Spanish text since "de" and "es" are extremely common Spanish words
-    single_tlds = SINGLE_TLDS
-    if language and language.lower() == 'es':
-        single_tlds = single_tlds.replace('de|', '').replace('|de', '')
-        single_tlds = single_tlds.replace('es|', '').replace('|es', '')
+    subdomain_single_re, single_re = _SINGLE_TLD_RES[bool(language) and language.lower() == 'es']
     
     def _mask_single(m):
         label = m.group(1)
@@ -90,21 +118,17 @@ def mask_domains(text: str, use_exclusions: bool = True, language: str | None =
     # CRITICAL: Apply subdomain patterns FIRST to avoid conflicts with basic domain patterns
     
     # Mask subdomain compound TLDs: "www.domain.co.uk" -> "www__DOT__domain__DOT__co_DOT_uk"
-    subdomain_compound_pattern = rf"\b((?:www|ftp|mail|blog|shop|app|api|cdn|static|news|support|help|docs|admin|secure|login|m|mobile|store|sub|dev|test|staging|prod|beta|alpha)\.)([a-zA-Z0-9\u00C0-\u017F\-]+)\.({COMPOUND_TLDS})\b"
-    masked = re.sub(subdomain_compound_pattern, _mask_subdomain_compound, text, flags=re.IGNORECASE)
+    masked = _SUBDOMAIN_COMPOUND_RE.sub(_mask_subdomain_compound, text)
     
     # Mask subdomain single TLDs: "www.domain.com" -> "www__DOT__domain__DOT__com"
-    subdomain_single_pattern = rf"\b((?:www|ftp|mail|blog|shop|app|api|cdn|static|news|support|help|docs|admin|secure|login|m|mobile|store|sub|dev|test|staging|prod|beta|alpha)\.)([a-zA-Z0-9\u00C0-\u017F\-]+)\.({single_tlds})\b"
-    masked = re.sub(subdomain_single_pattern, _mask_subdomain, masked, flags=re.IGNORECASE)
+    masked = subdomain_single_re.sub(_mask_subdomain, masked)
     
     # Then apply compound TLD masking for remaining domains (non-subdomain)
     # Mask compound TLDs: "domain.co.uk" -> "domain__DOT__co_DOT_uk"
-    # Updated pattern to include accented characters (Unicode \u00C0-\u017F covers Latin-1 Supplement and Latin Extended-A)
-    masked = re.sub(rf"\b([a-zA-Z0-9\u00C0-\u017F\-]+)\.({COMPOUND_TLDS})\b", _mask_compound, masked, flags=re.IGNORECASE)
+    masked = _COMPOUND_DOMAIN_RE.sub(_mask_compound, masked)
     
     # Finally mask single TLDs: "domain.com" -> "domain__DOT__com"  
-    # Updated pattern to include accented characters for domains like sinónimosonline.com
-    masked = re.sub(rf"\b([a-zA-Z0-9\u00C0-\u017F\-]+)\.({single_tlds})\b", _mask_single, masked, flags=re.IGNORECASE)
+    masked = single_re.sub(_mask_single, masked)
     
     return masked
 
@@ -147,11 +171,7 @@ def fix_spaced_domains(text: str, use_exclusions: bool = True, language: str | N
         "Visit google. com and uno. de" -> "Visit google.com and uno. de" (with exclusions)
         "Tratada. de hecho" -> "Tratada. de hecho" (Spanish: .de/.es excluded)
     """
-    # Exclude .de and .es TLDs for Spanish text since "de" and "es" are extremely common Spanish words
-    single_tlds = SINGLE_TLDS
-    if language and language.lower() == 'es':
-        single_tlds = single_tlds.replace('de|', '').replace('|de', '')
-        single_tlds = single_tlds.replace('es|', '').replace('|es', '')
+    single_tlds = _single_tlds_for_language(language)
     
     def _fix_single_tld(m):
         label = m.group(1)
@@ -35,6 +35,8 @@ import os
 import time
 import argparse
 import logging
+from bisect import bisect_left
+from contextlib import nullcontext
 from pathlib import Path
 from typing import TypedDict, TYPE_CHECKING, cast
 
@@ -426,7 +428,7 @@ def _write_txt(sentences, output_file, language: str | None = None):
     
     Args:
         sentences: List of Sentence objects (or strings for backward compat)
-        output_file: Path to output file
+        output_file: Path to output file, or an open text stream (left open)
         language: Language code for domain fixing
     """
     def _capitalize_first_letter(text: str) -> str:
@@ -475,118 +477,125 @@ def _write_txt(sentences, output_file, language: str | None = None):
         
         return text
     
-    with open(output_file, "w") as f:
-        prev_speaker = None
-        sentences_with_speaker_changes = 0
-        
-        for sentence_obj in sentences:
-            # Handle backward compatibility with string sentences
-            if not isinstance(sentence_obj, Sentence):
-                s = (sentence_obj or "").strip()
-                if s:
-                    # SAFETY NET: Ensure space after sentence-ending punctuation
-                    # (This may incorrectly add spaces to domains, but fix_spaced_domains() will fix them)
-                    s = re.sub(r'([.!?])([A-ZÁÉÍÓÚÑa-záéíóúñ¿¡])', r'\1 \2', s)
-                    # Fix domains AFTER safety net (removes incorrectly added spaces from domains)
-                    s = fix_spaced_domains(s, use_exclusions=True, language=language)
-                    s = _fix_mid_sentence_capitals(s)
-                    s = _capitalize_first_letter(s)
-                    f.write(f"{s}\n\n")
-                continue
-            
-            # Check if this sentence contains multiple speakers
-            if sentence_obj.has_speaker_changes():
-                sentences_with_speaker_changes += 1
-                
-                # Merge consecutive utterances from the same speaker, then split by speaker changes
-                merged_utterances = []
-                current_utterance = None
-                
-                for utterance in sentence_obj.utterances:
-                    if not utterance.text or not utterance.text.strip():
-                        continue
-                    
-                    if current_utterance is None:
-                        current_utterance = {
-                            'text': utterance.text,
-                            'speaker': utterance.speaker
-                        }
-                    elif current_utterance['speaker'] == utterance.speaker:
-                        # Same speaker - merge
-                        current_utterance['text'] += ' ' + utterance.text
-                    else:
-                        # Different speaker - save current and start new
-                        merged_utterances.append(current_utterance)
-                        current_utterance = {
-                            'text': utterance.text,
-                            'speaker': utterance.speaker
-                        }
-                
-                # Don't forget the last one
-                if current_utterance:
-                    merged_utterances.append(current_utterance)
-                
-                # FIX (v0.6.0): Only split if all utterances are substantial (≥3 words)
-                # This prevents excessive fragmentation from short interjections
-                MIN_UTTERANCE_WORDS = 3
-                all_substantial = all(
-                    len(u['text'].split()) >= MIN_UTTERANCE_WORDS 
-                    for u in merged_utterances
-                )
-                
-                if all_substantial and len(merged_utterances) > 1:
-                    # All utterances are substantial - split them
-                    for idx, merged in enumerate(merged_utterances):
-                        text = merged['text'].strip()
-                        if text:
-                            # SAFETY NET: Ensure space after sentence-ending punctuation
-                            text = re.sub(r'([.!?])([A-ZÁÉÍÓÚÑa-záéíóúñ¿¡])', r'\1 \2', text)
-                            # Fix domains AFTER safety net (removes incorrectly added spaces)
-                            text = fix_spaced_domains(text, use_exclusions=True, language=language)
-                            text = _fix_mid_sentence_capitals(text)
-                            # Capitalize each utterance since they become separate paragraphs
-                            text = _capitalize_first_letter(text)
-                            f.write(f"{text}\n\n")
-                            prev_speaker = merged['speaker']
-                else:
-                    # Some utterances are too short - keep sentence together
-                    full_text = sentence_obj.text.strip()
-                    if full_text:
-                        # SAFETY NET: Ensure space after sentence-ending punctuation
-                        full_text = re.sub(r'([.!?])([A-ZÁÉÍÓÚÑa-záéíóúñ¿¡])', r'\1 \2', full_text)
-                        # Fix domains AFTER safety net (removes incorrectly added spaces)
-                        full_text = fix_spaced_domains(full_text, use_exclusions=True, language=language)
-                        full_text = _fix_mid_sentence_capitals(full_text)
-                        full_text = _capitalize_first_letter(full_text)
-                        f.write(f"{full_text}\n\n")
-                        prev_speaker = sentence_obj.get_first_speaker()
-            else:
-                # Single speaker sentence - write as one paragraph
-                s = (sentence_obj.text or "").strip()
-                if not s:
-                    continue
-                
+    paragraphs: list[str] = []
+    prev_speaker = None
+    sentences_with_speaker_changes = 0
+    
+    for sentence_obj in sentences:
+        # Handle backward compatibility with string sentences
+        if not isinstance(sentence_obj, Sentence):
+            s = (sentence_obj or "").strip()
+            if s:
                 # SAFETY NET: Ensure space after sentence-ending punctuation
-                # This catches any concatenations that slipped through earlier stages
+                # (This may incorrectly add spaces to domains, but fix_spaced_domains() will fix them)
                 s = re.sub(r'([.!?])([A-ZÁÉÍÓÚÑa-záéíóúñ¿¡])', r'\1 \2', s)
-                
                 # Fix domains AFTER safety net (removes incorrectly added spaces from domains)
                 s = fix_spaced_domains(s, use_exclusions=True, language=language)
                 s = _fix_mid_sentence_capitals(s)
                 s = _capitalize_first_letter(s)
-                f.write(f"{s}\n\n")
-                prev_speaker = sentence_obj.get_first_speaker()
+                paragraphs.append(s)
+            continue
         
-        logger.debug(f"Found {sentences_with_speaker_changes} sentences with speaker changes")
+        # Check if this sentence contains multiple speakers
+        if sentence_obj.has_speaker_changes():
+            sentences_with_speaker_changes += 1
+            
+            # Merge consecutive utterances from the same speaker, then split by speaker changes
+            merged_utterances = []
+            current_utterance = None
+            
+            for utterance in sentence_obj.utterances:
+                if not utterance.text or not utterance.text.strip():
+                    continue
+                
+                if current_utterance is None:
+                    current_utterance = {
+                        'text': utterance.text,
+                        'speaker': utterance.speaker
+                    }
+                elif current_utterance['speaker'] == utterance.speaker:
+                    # Same speaker - merge
+                    current_utterance['text'] += ' ' + utterance.text
+                else:
+                    # Different speaker - save current and start new
+                    merged_utterances.append(current_utterance)
+                    current_utterance = {
+                        'text': utterance.text,
+                        'speaker': utterance.speaker
+                    }
+            
+            # Don't forget the last one
+            if current_utterance:
+                merged_utterances.append(current_utterance)
+            
+            # FIX (v0.6.0): Only split if all utterances are substantial (≥3 words)
+            # This prevents excessive fragmentation from short interjections
+            MIN_UTTERANCE_WORDS = 3
+            all_substantial = all(
+                len(u['text'].split()) >= MIN_UTTERANCE_WORDS 
+                for u in merged_utterances
+            )
+            
+            if all_substantial and len(merged_utterances) > 1:
+                # All utterances are substantial - split them
+                for idx, merged in enumerate(merged_utterances):
+                    text = merged['text'].strip()
+                    if text:
+                        # SAFETY NET: Ensure space after sentence-ending punctuation
+                        text = re.sub(r'([.!?])([A-ZÁÉÍÓÚÑa-záéíóúñ¿¡])', r'\1 \2', text)
+                        # Fix domains AFTER safety net (removes incorrectly added spaces)
+                        text = fix_spaced_domains(text, use_exclusions=True, language=language)
+                        text = _fix_mid_sentence_capitals(text)
+                        # Capitalize each utterance since they become separate paragraphs
+                        text = _capitalize_first_letter(text)
+                        paragraphs.append(text)
+                        prev_speaker = merged['speaker']
+            else:
+                # Some utterances are too short - keep sentence together
+                full_text = sentence_obj.text.strip()
+                if full_text:
+                    # SAFETY NET: Ensure space after sentence-ending punctuation
+                    full_text = re.sub(r'([.!?])([A-ZÁÉÍÓÚÑa-záéíóúñ¿¡])', r'\1 \2', full_text)
+                    # Fix domains AFTER safety net (removes incorrectly added spaces)
+                    full_text = fix_spaced_domains(full_text, use_exclusions=True, language=language)
+                    full_text = _fix_mid_sentence_capitals(full_text)
+                    full_text = _capitalize_first_letter(full_text)
+                    paragraphs.append(full_text)
+                    prev_speaker = sentence_obj.get_first_speaker()
+        else:
+            # Single speaker sentence - write as one paragraph
+            s = (sentence_obj.text or "").strip()
+            if not s:
+                continue
+            
+            # SAFETY NET: Ensure space after sentence-ending punctuation
+            # This catches any concatenations that slipped through earlier stages
+            s = re.sub(r'([.!?])([A-ZÁÉÍÓÚÑa-záéíóúñ¿¡])', r'\1 \2', s)
+            
+            # Fix domains AFTER safety net (removes incorrectly added spaces from domains)
+            s = fix_spaced_domains(s, use_exclusions=True, language=language)
+            s = _fix_mid_sentence_capitals(s)
+            s = _capitalize_first_letter(s)
+            paragraphs.append(s)
+            prev_speaker = sentence_obj.get_first_speaker()
+    
+    logger.debug(f"Found {sentences_with_speaker_changes} sentences with speaker changes")
+    
+    # Write once, after formatting, so a failure mid-way doesn't leave a truncated file
+    out = nullcontext(output_file) if hasattr(output_file, "write") else open(output_file, "w")
+    with out as f:
+        f.write("".join(f"{p}\n\n" for p in paragraphs))
 
 def _write_srt(segments, output_file):
     def format_timestamp(seconds):
         h = int(seconds // 3600); m = int((seconds % 3600) // 60); s = int(seconds % 60); ms = int((seconds - int(seconds)) * 1000)
         return f"{h:02}:{m:02}:{s:02},{ms:03}"
+    cues = (
+        f"{i}\n{format_timestamp(seg['start'])} --> {format_timestamp(seg['end'])}\n{seg['text'].strip()}\n\n"
+        for i, seg in enumerate(segments, 1)
+    )
     with open(output_file, "w") as f:
-        for i, seg in enumerate(segments, 1):
-            start = format_timestamp(seg['start']); end = format_timestamp(seg['end']); text = seg['text'].strip()
-            f.write(f"{i}\n{start} --> {end}\n{text}\n\n")
+        f.write("".join(cues))
 
 def _write_raw(segments, output_file, detected_language: str | None = None, task: str = "transcribe"):
     """Write raw transcription data for debugging purposes."""
@@ -751,7 +760,7 @@ def _transcribe_chunked(model, media_file: str, language, beam_size: int, *, tra
 def _convert_speaker_timestamps_to_char_positions(
     speaker_boundaries: list[float],
     whisper_segments: list[dict],
-    text: str
+    text: str | None = None
 ) -> list[int]:
     """
     Convert speaker boundary timestamps (seconds) to character positions in the text.
@@ -767,7 +776,9 @@ def _convert_speaker_timestamps_to_char_positions(
     Args:
         speaker_boundaries: List of timestamps (seconds) where speakers change
         whisper_segments: List of Whisper segment dicts with 'start', 'end', 'text' fields
-        text: The full concatenated text from all segments
+        text: The full concatenated text from all segments. Optional and not read:
+            positions are derived from segment text lengths, so callers need not
+            build the joined string
         
     Returns:
         List of character positions corresponding to speaker boundaries
@@ -775,62 +786,42 @@ def _convert_speaker_timestamps_to_char_positions(
     if not speaker_boundaries or not whisper_segments:
         return []
     
-    # Build a mapping of segment index to character end position
+    # Build parallel start/end/char_end lists over the non-empty segments
     # This mirrors the logic in _extract_segment_boundaries from punctuation_restorer.py
-    segment_char_positions = []
+    seg_starts: list[float] = []
+    seg_ends: list[float] = []
+    seg_char_ends: list[int] = []
     position = 0
     for seg in whisper_segments:
         seg_text = seg.get('text', '').strip()
         if not seg_text:
             continue
         position += len(seg_text)
-        segment_char_positions.append({
-            'start': seg.get('start', 0),
-            'end': seg.get('end', 0),
-            'char_end': position,
-            'text': seg_text
-        })
+        seg_starts.append(seg.get('start', 0))
+        seg_ends.append(seg.get('end', 0))
+        seg_char_ends.append(position)
         position += 1  # Account for separator (space or newline)
     
-    if not segment_char_positions:
+    if not seg_char_ends:
         return []
     
-    # For each speaker boundary, find the best matching segment
+    # Whisper segments are time-ordered (chunked output is deduped to increasing
+    # end times), so each boundary's segment can be found by binary search:
+    # - the first segment ending at/after the boundary, if it starts by then
+    #   (boundary falls within it)
+    # - otherwise the closest segment ending before the boundary (speaker change in
+    #   a gap); the earliest of equal ends, as a linear scan would pick
+    # - otherwise the first segment, which starts after the boundary
     char_positions = []
     for boundary_time in speaker_boundaries:
-        best_segment = None
-        min_distance = float('inf')
-        segment_idx = -1
-        
-        for idx, seg_info in enumerate(segment_char_positions):
-            seg_start = seg_info['start']
-            seg_end = seg_info['end']
-            
-            # Check if boundary falls within this segment
-            if seg_start <= boundary_time <= seg_end:
-                best_segment = seg_info
-                segment_idx = idx
-                break
-            
-            # Otherwise, find the segment whose end is closest to (but not after) the boundary
-            # This handles cases where the speaker change happens in a gap between segments
-            if seg_end <= boundary_time:
-                distance = boundary_time - seg_end
-                if distance < min_distance:
-                    min_distance = distance
-                    best_segment = seg_info
-                    segment_idx = idx
-        
-        # If no segment ends before the boundary, use the first segment after it
-        if best_segment is None:
-            for idx, seg_info in enumerate(segment_char_positions):
-                if seg_info['start'] >= boundary_time:
-                    best_segment = seg_info
-                    segment_idx = idx
-                    break
-        
-        if best_segment:
-            char_positions.append(best_segment['char_end'])
+        idx = bisect_left(seg_ends, boundary_time)
+        if idx < len(seg_ends) and seg_starts[idx] <= boundary_time:
+            segment_idx = idx
+        elif idx > 0:
+            segment_idx = bisect_left(seg_ends, seg_ends[idx - 1])
+        else:
+            segment_idx = 0
+        char_positions.append(seg_char_ends[segment_idx])
     
     # Remove duplicates while preserving order
     seen = set()
@@ -121,6 +121,8 @@ except ImportError:
     logger.info("spacy-language-detection not available. Will use fallback heuristics for mixed-language content.")
 
 
+# Embedding model for semantic punctuation checks; the semantic thresholds are tuned for it
+_SENTENCE_TRANSFORMER_MODEL = 'sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2'
 _SENTENCE_TRANSFORMER_SINGLETON = None
 
 """
@@ -271,6 +273,16 @@ def _split_sentences_preserving_delims(text: str) -> list:
     return PUNCT_SPLIT_RE.split(text)
 
 
+_PERIOD_QUESTION_RE = re.compile(r"\.\s*\?")
+_QUESTION_PERIOD_RE = re.compile(r"\?\s*\.")
+_EXCLAMATION_PERIOD_RE = re.compile(r"!\s*\.")
+_EXCLAMATION_QUESTION_RE = re.compile(r"!\s*\?")
+_QUESTION_EXCLAMATION_RE = re.compile(r"\?\s*!")
+_FOUR_PLUS_DOTS_RE = re.compile(r"\.{4,}")
+_DOUBLE_DOT_RE = re.compile(r"(?<!\.)\.\.(?!\.)")
+_REPEATED_QE_RE = re.compile(r"([!?]){2,}")
+
+
 def _normalize_mixed_terminal_punctuation(text: str) -> str:
     """Normalize mixed terminal punctuation like '?.', '!.', '!?'.
 
@@ -284,16 +296,16 @@ def _normalize_mixed_terminal_punctuation(text: str) -> str:
     """
     out = text
     # Mixed pairs
-    out = re.sub(r"\.\s*\?", "?", out)   # .? -> ?
-    out = re.sub(r"\?\s*\.", "?", out)    # ?. -> ?
-    out = re.sub(r"!\s*\.", "!", out)      # !. -> !
-    out = re.sub(r"!\s*\?", "!", out)      # !? -> !
-    out = re.sub(r"\?\s*!", "!", out)      # ?! -> !
+    out = _PERIOD_QUESTION_RE.sub("?", out)       # .? -> ?
+    out = _QUESTION_PERIOD_RE.sub("?", out)       # ?. -> ?
+    out = _EXCLAMATION_PERIOD_RE.sub("!", out)    # !. -> !
+    out = _EXCLAMATION_QUESTION_RE.sub("!", out)  # !? -> !
+    out = _QUESTION_EXCLAMATION_RE.sub("!", out)  # ?! -> !
     # Preserve ellipses
-    out = re.sub(r"\.{4,}", "...", out)     # 4+ dots -> ...
-    out = re.sub(r"(?<!\.)\.\.(?!\.)", ".", out)  # exactly two dots -> one
+    out = _FOUR_PLUS_DOTS_RE.sub("...", out)      # 4+ dots -> ...
+    out = _DOUBLE_DOT_RE.sub(".", out)            # exactly two dots -> one
     # Collapse runs of question/exclamation
-    out = re.sub(r"([!?]){2,}", r"\1", out)
+    out = _REPEATED_QE_RE.sub(r"\1", out)
     return out
 
 
@@ -383,6 +395,18 @@ def _fix_location_appositive_punctuation(text: str, language: str) -> str:
     return result
 
 
+# Comma-spacing and finalize passes run on every sentence; compile them once.
+_SPACE_BEFORE_COMMA_RE = re.compile(r"\s+,")
+_REPEATED_COMMA_RE = re.compile(r",\s*,+")
+_SPACES_AFTER_COMMA_RE = re.compile(r",\s+")
+_MISSING_SPACE_AFTER_COMMA_RE = re.compile(r",(?=\S)")
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+_PERIOD_BEFORE_LETTER_RE = re.compile(r"(?<!\.)(?<![A-Z])\.\s*([A-Za-zÁÉÍÓÚÑáéíóúñ])")
+_QUESTION_BEFORE_LETTER_RE = re.compile(r"\?\s*([A-Za-zÁÉÍÓÚÑáéíóúñ])")
+_EXCLAMATION_BEFORE_LETTER_RE = re.compile(r"!\s*([A-Za-zÁÉÍÓÚÑáéíóúñ])")
+_LOWERCASE_AFTER_TERMINATOR_RE = re.compile(r"([.!?])\s+([a-záéíóúñ])")
+
+
 def _normalize_comma_spacing(text: str) -> str:
     """Normalize comma spacing in text.
     
@@ -417,17 +441,17 @@ def _normalize_comma_spacing(text: str) -> str:
         return text if text is not None else ""
     
     # 1) Remove spaces before commas everywhere
-    text = re.sub(r"\s+,", ",", text)
+    text = _SPACE_BEFORE_COMMA_RE.sub(",", text)
     
     # 2) Deduplicate accidental double commas (allowing optional spaces between)
     # e.g., ", ," -> ", " or ",,," -> ", "
-    text = re.sub(r",\s*,+", ", ", text)
+    text = _REPEATED_COMMA_RE.sub(", ", text)
     
     # 3) Normalize space after commas: ensure exactly one space (or none if at end)
     # First, normalize any existing spaces after commas
-    text = re.sub(r",\s+", ", ", text)
+    text = _SPACES_AFTER_COMMA_RE.sub(", ", text)
     # Then add space where missing (when followed by non-whitespace)
-    text = re.sub(r",(?=\S)", ", ", text)
+    text = _MISSING_SPACE_AFTER_COMMA_RE.sub(", ", text)
     
     return text
 
@@ -443,17 +467,17 @@ def _finalize_text_common(text: str) -> str:
     if not text:
         return text
     out = _normalize_mixed_terminal_punctuation(text)
-    out = re.sub(r"\s+", " ", out)
+    out = _WHITESPACE_RUN_RE.sub(" ", out)
     # Use centralized domain masking with Spanish exclusions
     masked = mask_domains(out, use_exclusions=True, language='es')
     # Ensure single space after sentence punctuation when followed by a letter (including lowercase accented)
     # But NOT for person initials like "C.S." where the period is part of the initial
     # Use negative lookbehind to avoid: periods in ellipses, periods after single capital letters (initials)
-    masked = re.sub(r"(?<!\.)(?<![A-Z])\.\s*([A-Za-zÁÉÍÓÚÑáéíóúñ])", r". \1", masked)
-    masked = re.sub(r"\?\s*([A-Za-zÁÉÍÓÚÑáéíóúñ])", r"? \1", masked)
-    masked = re.sub(r"!\s*([A-Za-zÁÉÍÓÚÑáéíóúñ])", r"! \1", masked)
+    masked = _PERIOD_BEFORE_LETTER_RE.sub(r". \1", masked)
+    masked = _QUESTION_BEFORE_LETTER_RE.sub(r"? \1", masked)
+    masked = _EXCLAMATION_BEFORE_LETTER_RE.sub(r"! \1", masked)
     # Capitalize after terminators when appropriate
-    masked = re.sub(r"([.!?])\s+([a-záéíóúñ])", lambda m: f"{m.group(1)} {m.group(2).upper()}", masked)
+    masked = _LOWERCASE_AFTER_TERMINATOR_RE.sub(lambda m: f"{m.group(1)} {m.group(2).upper()}", masked)
     # Unmask domains using centralized function
     out = unmask_domains(masked)
     # Normalize comma spacing using centralized function
@@ -990,6 +1014,23 @@ def _es_intro_location_appositive_commas(text: str) -> str:
 _QUESTION_PATTERN_EMBEDDINGS = {}
 _EXCL_PATTERN_EMBEDDINGS = {}
 
+# Per-sentence embeddings shared by the question and exclamation checks, which
+# otherwise encode the same sentence twice. Bounded so long transcripts don't grow it.
+_SENTENCE_EMBEDDINGS = {}
+_SENTENCE_EMBEDDINGS_MAX = 4096
+
+
+def _encode_sentence(sentence: str, model):
+    """Embed a sentence, cached by sentence text only (assumes the single process-wide encoder, like the pattern caches)."""
+    emb = _SENTENCE_EMBEDDINGS.get(sentence)
+    if emb is None:
+        emb = model.encode([sentence])[0]
+        if len(_SENTENCE_EMBEDDINGS) >= _SENTENCE_EMBEDDINGS_MAX:
+            _SENTENCE_EMBEDDINGS.pop(next(iter(_SENTENCE_EMBEDDINGS)))
+        _SENTENCE_EMBEDDINGS[sentence] = emb
+    return emb
+
+
 def _get_question_pattern_embeddings(language: str, model):
     if language in _QUESTION_PATTERN_EMBEDDINGS:
         return _QUESTION_PATTERN_EMBEDDINGS[language]
@@ -1062,7 +1103,7 @@ def _find_local_model_path(preferred_st_cache: str, model_name: str) -> str | No
     return None
 
 
-def _load_sentence_transformer(model_name: str = 'sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2'):
+def _load_sentence_transformer(model_name: str = _SENTENCE_TRANSFORMER_MODEL):
     """Load SentenceTransformer once, preferring local cache and enabling offline when possible."""
     global _SENTENCE_TRANSFORMER_SINGLETON
     if _SENTENCE_TRANSFORMER_SINGLETON is not None:
@@ -1076,7 +1117,7 @@ def _load_sentence_transformer(model_name: str = 'sentence-transformers/paraphra
     # Ensure HF_HOME points to our preferred cache to consolidate downloads
     os.environ.setdefault("HF_HOME", hf_cache)
 
-    short_name = 'paraphrase-multilingual-MiniLM-L12-v2'
+    short_name = _SENTENCE_TRANSFORMER_MODEL.split('/')[-1]
 
     logger.info(f"Loading punctuation model ({short_name})...")
 
@@ -1382,7 +1423,7 @@ def _transformer_based_restoration(text: str, language: str = 'en', use_custom_p
         tuple[str, list[Sentence]]: (processed_text, sentences_list)
     """
     # Initialize the model once (use multilingual model for better language support)
-    model = _load_sentence_transformer('sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2')
+    model = _load_sentence_transformer()
     if model is None:
         # Fallback path if sentence-transformers is unavailable
         # Text is already normalized in podscripter.py (v0.4.3)
@@ -1693,7 +1734,7 @@ def _transformer_based_restoration(text: str, language: str = 'en', use_custom_p
         sentences = re.split(r'([.!?]+)', result_masked_for_semantic)
         # Unmask domains in the split sentences
         sentences = [re.sub(r"__DOT__", ".", s) for s in sentences]
-        model_for_gate = _load_sentence_transformer('sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2')
+        model_for_gate = _load_sentence_transformer()
         for i in range(0, len(sentences), 2):
             if i < len(sentences):
                 sentence_text = sentences[i].strip()
@@ -2139,7 +2180,7 @@ def _transformer_based_restoration_segment(text: str, language: str = 'en') -> s
     to incomplete phrases that should be carried forward.
     """
     # Initialize the model once (use multilingual model for better language support)
-    model = _load_sentence_transformer('sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2')
+    model = _load_sentence_transformer()
     if model is None:
         # Fallback path if sentence-transformers is unavailable
         text = re.sub(r'\s+', ' ', text.strip())
@@ -2271,7 +2312,7 @@ def is_question_semantic(sentence: str, model, language: str) -> bool:
     
     try:
         # Encode sentence and re-use cached pattern embeddings
-        sentence_embedding = model.encode([sentence])[0]
+        sentence_embedding = _encode_sentence(sentence, model)
         cached = _get_question_pattern_embeddings(language, model)
         if cached is None:
             return False
@@ -2296,6 +2337,79 @@ def is_question_semantic(sentence: str, model, language: str) -> bool:
         return False
 
 
+# Lookup tables for has_question_indicators, built once instead of on every call.
+# Question words (Spanish excludes standalone 'por' and 'de'; handled as phrases like 'por qué', 'de quién')
+_QUESTION_WORDS = {
+    'en': ('what', 'where', 'when', 'why', 'how', 'who', 'which', 'whose', 'whom'),
+    'es': ('qué', 'dónde', 'cuándo', 'cómo', 'quién', 'cuál', 'cuáles'),
+    'de': ('was', 'wo', 'wann', 'warum', 'wie', 'wer', 'welche', 'welches', 'wessen'),
+    'fr': ('quoi', 'où', 'quand', 'pourquoi', 'comment', 'qui', 'quel', 'quelle', 'quels', 'quelles'),
+}
+_QUESTION_WORD_PREFIXES = {lang: tuple(w + ' ' for w in words) for lang, words in _QUESTION_WORDS.items()}
+# Spanish question-word and verb-based (present and past tense) question starters
+_ES_QUESTION_STARTER_PREFIXES = tuple(w + ' ' for w in (
+    *ES_QUESTION_WORDS_CORE, 'como', 'cuáles',
+    'puedes', 'puede', 'pudiste', 'pudo', 'pudieron', 'pudimos',
+    'sabes', 'sabe', 'supiste', 'supo', 'supieron',
+    'quieres', 'quiere', 'quisiste', 'quiso', 'quisieron',
+    'necesitas', 'necesita', 'necesitaste', 'necesitó', 'necesitaron',
+    'tienes', 'tiene', 'tuviste', 'tuvo', 'tuvieron',
+    'vas', 'va', 'fuiste', 'fue', 'fueron',
+    'estás', 'están', 'estuviste', 'estuvo', 'estuvieron',
+))
+_ES_STRONG_QUESTION_WORDS = tuple(ES_QUESTION_WORDS_CORE[:-1])
+_ES_STRONG_QUESTION_PREFIXES = tuple(w + ' ' for w in ES_QUESTION_WORDS_CORE)
+_ES_COURTESY_PHRASES = ('gracias', 'por favor', 'de nada', 'no hay problema')
+_ES_SER_ESTAR_WORDS = ('soy', 'es', 'estoy', 'está', 'están', 'somos', 'son')
+_ES_EMBEDDED_INTRO_PATTERNS = (
+    'yo soy', 'mi nombre es', 'me llamo', 'vivo en', 'trabajo en',
+    'soy de', 'es de', 'estoy de', 'está de', 'están de',
+)
+_ES_LOCATION_DE_PATTERNS = (
+    'de colombia', 'de españa', 'de méxico', 'de argentina', 'de santander',
+    'de acuerdo', 'de nada', 'de verdad', 'de hecho',
+)
+_ES_QUESTION_PHRASES = ('por qué', 'de quién', 'a quién')
+_ES_NON_QUESTION_PREFIXES = ('hola ', 'buenos días ', 'buenas tardes ', 'buenas noches ', 'gracias ', 'por favor ')
+_ES_STATEMENT_PATTERNS = (
+    'el proyecto', 'la reunión', 'necesito', 'quiero', 'voy a', 'tengo que',
+    'es importante', 'es necesario', 'es correcto', 'está bien',
+)
+_ES_SER_ESTAR_STATEMENT_PATTERNS = (
+    'yo soy', 'yo es', 'yo estoy', 'yo está', 'yo están',
+    'soy de', 'es de', 'estoy de', 'está de', 'están de',
+    'mi nombre es', 'me llamo', 'vivo en', 'trabajo en',
+)
+# These patterns are almost never questions in Spanish
+_ES_INTRODUCTION_PATTERNS = (
+    'soy', 'es', 'estoy', 'está', 'están', 'somos', 'son',
+    'mi nombre', 'me llamo', 'vivo en', 'trabajo en', 'estudio en',
+    'soy de', 'es de', 'estoy de', 'está de', 'están de',
+    'de acuerdo', 'de colombia', 'de españa', 'de méxico', 'de argentina',
+)
+# Question intonation patterns (common in speech)
+_EN_QUESTION_PATTERNS = (
+    'can you', 'could you', 'would you', 'will you', 'do you', 'does', 'did you',
+    'are you', 'is this', 'is that', 'are they', 'is it', 'am i',
+)
+# Be more specific to avoid false positives with "ser" and "estar" verbs
+_ES_QUESTION_PATTERNS = (
+    'puedes', 'puede', 'podrías', 'podría', 'vas a', 'va a', 'vas', 'va',
+    'tienes', 'tiene', 'tienes que', 'tiene que', 'necesitas', 'necesita',
+    'sabes', 'sabe', 'conoces', 'conoce', 'hay',
+    'te gusta', 'le gusta', 'te gustaría', 'le gustaría', 'quieres', 'quiere',
+    'te parece', 'le parece', 'crees', 'cree', 'piensas', 'piensa',
+)
+_ES_QUESTION_WORD_COMBINATIONS = (
+    'qué hora', 'qué día', 'qué fecha', 'qué tiempo', 'qué tal', 'qué pasa',
+    'dónde está', 'dónde vas', 'dónde queda', 'dónde puedo',
+    'cuándo es', 'cuándo va', 'cuándo viene', 'cuándo sale',
+    'cómo está', 'cómo va', 'cómo te', 'cómo se', 'cómo puedo',
+    'quién es', 'quién está', 'quién va', 'quién puede',
+    'cuál es', 'cuáles son', 'cuál prefieres', 'cuál te gusta',
+)
+
+
 def has_question_indicators(sentence, language):
     """
     Check for obvious question indicators in the sentence.
@@ -2309,41 +2423,16 @@ def has_question_indicators(sentence, language):
     """
     sentence_lower = sentence.lower()
     
-    # Question words (Spanish excludes standalone 'por' and 'de'; handled as phrases like 'por qué', 'de quién')
-    question_words = {
-        'en': ['what', 'where', 'when', 'why', 'how', 'who', 'which', 'whose', 'whom'],
-        'es': ['qué', 'dónde', 'cuándo', 'cómo', 'quién', 'cuál', 'cuáles'],
-        'de': ['was', 'wo', 'wann', 'warum', 'wie', 'wer', 'welche', 'welches', 'wessen'],
-        'fr': ['quoi', 'où', 'quand', 'pourquoi', 'comment', 'qui', 'quel', 'quelle', 'quels', 'quelles']
-    }
-    
-    words = question_words.get(language, question_words['en'])
+    words = _QUESTION_WORDS.get(language, _QUESTION_WORDS['en'])
     
     # Check if sentence starts with question words
-    for word in words:
-        if sentence_lower.startswith(word + ' '):
-            return True
+    if sentence_lower.startswith(_QUESTION_WORD_PREFIXES.get(language, _QUESTION_WORD_PREFIXES['en'])):
+        return True
     
-    # Special case for Spanish: check for question words at the beginning even without ¿
-    if language == 'es':
-        spanish_question_starters = ES_QUESTION_WORDS_CORE + ['como', 'cuáles']
-        for starter in spanish_question_starters:
-            if sentence_lower.startswith(starter + ' '):
-                return True
-        
-        # Check for verb-based question starters (present and past tense)
-        spanish_verb_starters = [
-            'puedes', 'puede', 'pudiste', 'pudo', 'pudieron', 'pudimos',
-            'sabes', 'sabe', 'supiste', 'supo', 'supieron',
-            'quieres', 'quiere', 'quisiste', 'quiso', 'quisieron',
-            'necesitas', 'necesita', 'necesitaste', 'necesitó', 'necesitaron',
-            'tienes', 'tiene', 'tuviste', 'tuvo', 'tuvieron',
-            'vas', 'va', 'fuiste', 'fue', 'fueron',
-            'estás', 'están', 'estuviste', 'estuvo', 'estuvieron'
-        ]
-        for starter in spanish_verb_starters:
-            if sentence_lower.startswith(starter + ' '):
-                return True
+    # Special case for Spanish: check for question words and verb-based starters
+    # at the beginning even without ¿
+    if language == 'es' and sentence_lower.startswith(_ES_QUESTION_STARTER_PREFIXES):
+        return True
     
     # Check for question words anywhere in the sentence (for embedded questions)
     # But be more conservative to avoid false positives
@@ -2354,31 +2443,25 @@ def has_question_indicators(sentence, language):
                 # Avoid false positives for common greetings and statements
                 if any(greeting in sentence_lower for greeting in _get_language_config('es').greetings):
                     continue
-                if any(statement in sentence_lower for statement in ['gracias', 'por favor', 'de nada', 'no hay problema']):
+                if any(statement in sentence_lower for statement in _ES_COURTESY_PHRASES):
                     continue
                 
                 # Avoid false positives for "ser" and "estar" verbs in introductions
-                if word in ['soy', 'es', 'estoy', 'está', 'están', 'somos', 'son']:
+                if word in _ES_SER_ESTAR_WORDS:
                     # Check if it's likely an introduction or statement
-                    if any(intro_pattern in sentence_lower for intro_pattern in [
-                        'yo soy', 'mi nombre es', 'me llamo', 'vivo en', 'trabajo en',
-                        'soy de', 'es de', 'estoy de', 'está de', 'están de'
-                    ]):
+                    if any(intro_pattern in sentence_lower for intro_pattern in _ES_EMBEDDED_INTRO_PATTERNS):
                         continue
                 
                 # Avoid false positives for "de" when used in locations/descriptions
                 if word == 'de':
                     # Check if "de" is used in location patterns (not questions)
-                    if any(location_pattern in sentence_lower for location_pattern in [
-                        'de colombia', 'de españa', 'de méxico', 'de argentina', 'de santander',
-                        'de acuerdo', 'de nada', 'de verdad', 'de hecho'
-                    ]):
+                    if any(location_pattern in sentence_lower for location_pattern in _ES_LOCATION_DE_PATTERNS):
                         continue
             return True
 
     # Spanish phrase checks (only as phrases)
     if language == 'es':
-        if any(phrase in sentence_lower for phrase in ['por qué', 'de quién', 'a quién']):
+        if any(phrase in sentence_lower for phrase in _ES_QUESTION_PHRASES):
             return True
     
     # Check for question marks already present
@@ -2388,48 +2471,32 @@ def has_question_indicators(sentence, language):
     # Additional Spanish-specific checks to avoid false positives
     if language == 'es':
         # Check if sentence starts with common non-question patterns
-        if sentence_lower.startswith(('hola ', 'buenos días ', 'buenas tardes ', 'buenas noches ', 'gracias ', 'por favor ')):
+        if sentence_lower.startswith(_ES_NON_QUESTION_PREFIXES):
             return False
         
         # Check if sentence contains common statement patterns
-        if any(pattern in sentence_lower for pattern in [
-            'el proyecto', 'la reunión', 'necesito', 'quiero', 'voy a', 'tengo que',
-            'es importante', 'es necesario', 'es correcto', 'está bien'
-        ]):
+        if any(pattern in sentence_lower for pattern in _ES_STATEMENT_PATTERNS):
             # Only consider it a question if it has strong question indicators
-            has_strong_question = any(word in sentence_lower for word in ES_QUESTION_WORDS_CORE[:-1])
+            has_strong_question = any(word in sentence_lower for word in _ES_STRONG_QUESTION_WORDS)
             if not has_strong_question:
                 return False
         
         # Prevent false positives with "ser" and "estar" verbs in statements
         # These are common in introductions and descriptions
-        if any(pattern in sentence_lower for pattern in [
-            'yo soy', 'yo es', 'yo estoy', 'yo está', 'yo están',
-            'soy de', 'es de', 'estoy de', 'está de', 'están de',
-            'mi nombre es', 'me llamo', 'vivo en', 'trabajo en'
-        ]):
+        if any(pattern in sentence_lower for pattern in _ES_SER_ESTAR_STATEMENT_PATTERNS):
             # Only consider it a question if it has strong question indicators
-            has_strong_question = any(word in sentence_lower for word in ES_QUESTION_WORDS_CORE[:-1])
+            has_strong_question = any(word in sentence_lower for word in _ES_STRONG_QUESTION_WORDS)
             if not has_strong_question:
                 return False
         
-        # Additional comprehensive check for introduction and statement patterns
-        # These patterns are almost never questions in Spanish
-        introduction_patterns = [
-            'soy', 'es', 'estoy', 'está', 'están', 'somos', 'son',
-            'mi nombre', 'me llamo', 'vivo en', 'trabajo en', 'estudio en',
-            'soy de', 'es de', 'estoy de', 'está de', 'están de',
-            'de acuerdo', 'de colombia', 'de españa', 'de méxico', 'de argentina'
-        ]
-        
-        # If the sentence contains these patterns and doesn't have strong question words, it's likely a statement
-        if any(pattern in sentence_lower for pattern in introduction_patterns):
+        # Additional comprehensive check for introduction and statement patterns:
+        # if the sentence contains these patterns and doesn't have strong question words, it's likely a statement
+        if any(pattern in sentence_lower for pattern in _ES_INTRODUCTION_PATTERNS):
             # Check for strong question indicators
-            strong_question_words = ES_QUESTION_WORDS_CORE
-            has_strong_question = any(word in sentence_lower for word in strong_question_words)
+            has_strong_question = any(word in sentence_lower for word in ES_QUESTION_WORDS_CORE)
             
             # Also check if it starts with a question word
-            starts_with_question = any(sentence_lower.startswith(word + ' ') for word in strong_question_words)
+            starts_with_question = sentence_lower.startswith(_ES_STRONG_QUESTION_PREFIXES)
             
             if not has_strong_question and not starts_with_question:
                 return False
@@ -2437,31 +2504,15 @@ def has_question_indicators(sentence, language):
     # Check for question intonation patterns (common in speech)
     if language == 'en':
         # Common question patterns in English
-        if any(pattern in sentence_lower for pattern in [
-            'can you', 'could you', 'would you', 'will you', 'do you', 'does', 'did you',
-            'are you', 'is this', 'is that', 'are they', 'is it', 'am i'
-        ]):
+        if any(pattern in sentence_lower for pattern in _EN_QUESTION_PATTERNS):
             return True
     elif language == 'es':
         # Common question patterns in Spanish
         # Be more specific to avoid false positives with "ser" and "estar" verbs
-        if any(pattern in sentence_lower for pattern in [
-            'puedes', 'puede', 'podrías', 'podría', 'vas a', 'va a', 'vas', 'va',
-            'tienes', 'tiene', 'tienes que', 'tiene que', 'necesitas', 'necesita',
-            'sabes', 'sabe', 'conoces', 'conoce', 'hay',
-            'te gusta', 'le gusta', 'te gustaría', 'le gustaría', 'quieres', 'quiere',
-            'te parece', 'le parece', 'crees', 'cree', 'piensas', 'piensa'
-        ]):
+        if any(pattern in sentence_lower for pattern in _ES_QUESTION_PATTERNS):
             return True
         # Check for Spanish question word combinations
-        if any(pattern in sentence_lower for pattern in [
-            'qué hora', 'qué día', 'qué fecha', 'qué tiempo', 'qué tal', 'qué pasa',
-            'dónde está', 'dónde vas', 'dónde queda', 'dónde puedo',
-            'cuándo es', 'cuándo va', 'cuándo viene', 'cuándo sale',
-            'cómo está', 'cómo va', 'cómo te', 'cómo se', 'cómo puedo',
-            'quién es', 'quién está', 'quién va', 'quién puede',
-            'cuál es', 'cuáles son', 'cuál prefieres', 'cuál te gusta'
-        ]):
+        if any(pattern in sentence_lower for pattern in _ES_QUESTION_WORD_COMBINATIONS):
             return True
     
     return False
@@ -2477,7 +2528,7 @@ def is_exclamation_semantic(sentence: str, model, language: str) -> bool:
     
     try:
         # Encode sentence and re-use cached pattern embeddings
-        sentence_embedding = model.encode([sentence])[0]
+        sentence_embedding = _encode_sentence(sentence, model)
         cached = _get_exclamation_pattern_embeddings(language, model)
         if cached is None:
             return False
@@ -3436,7 +3487,7 @@ def _spanish_cleanup_postprocess(text: str) -> str:
         r"hay|"
         r"te parece|le parece|crees|cree|piensas|piensa"
     )
-    model_gate = _load_sentence_transformer('sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2')
+    model_gate = _load_sentence_transformer()
     parts2 = _split_sentences_preserving_delims(text)
     for i in range(0, len(parts2), 2):
         if i >= len(parts2):
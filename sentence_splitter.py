@@ -55,7 +55,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger("podscripter.splitter")
 
 
-@dataclass
+@dataclass(slots=True)
 class Utterance:
     """A single speaker's utterance (may be part of a sentence)."""
     text: str
@@ -64,7 +64,7 @@ class Utterance:
     end_word: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Sentence:
     """A sentence that may contain utterances from multiple speakers."""
     text: str  # Full sentence text
@@ -243,10 +243,7 @@ def _extract_speaker_boundaries(segments: list[SpeakerSegment]) -> tuple[list[fl
     # Sort segments by start time to ensure proper ordering
     sorted_segments = sorted(segments, key=lambda s: s["start"])
     
-    for i in range(len(sorted_segments) - 1):
-        current = sorted_segments[i]
-        next_seg = sorted_segments[i + 1]
-        
+    for current, next_seg in zip(sorted_segments, sorted_segments[1:]):
         # Check if speaker changes
         if current["speaker"] != next_seg["speaker"]:
             # Use the end of the current segment as the boundary
@@ -310,20 +307,12 @@ def _merge_boundaries(
     all_boundaries.sort()
     
     # Deduplicate boundaries that are very close together
-    # Keep the first one in each cluster (which will be from speaker if present)
-    merged = []
-    i = 0
-    
-    while i < len(all_boundaries):
-        current = all_boundaries[i]
-        merged.append(current)
-        
-        # Skip any boundaries within epsilon of current
-        j = i + 1
-        while j < len(all_boundaries) and all_boundaries[j] - current <= epsilon:
-            j += 1
-        
-        i = j
+    # Keep the first one in each cluster (which will be from speaker if present);
+    # anything within epsilon of the last kept boundary is skipped
+    merged = [all_boundaries[0]]
+    for boundary in all_boundaries[1:]:
+        if boundary - merged[-1] > epsilon:
+            merged.append(boundary)
     
     return merged
 
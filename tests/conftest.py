@@ -1,23 +1,60 @@
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from functools import lru_cache
 
 import pytest
 from sentence_splitter import SentenceSplitter
 from punctuation_restorer import restore_punctuation as _restore_punctuation
 
 
+def _text_only(result):
+    if isinstance(result, tuple):
+        return result[0]
+    return result
+
+
+@lru_cache(maxsize=1024)
+def _restore_text_cached(text, language):
+    return _text_only(_restore_punctuation(text, language))
+
+
 def restore_punctuation(text, language='en', **kwargs):
     """Wrapper around restore_punctuation that returns only the text string.
 
     The real restore_punctuation returns (text, sentences). Tests almost always
-    only need the text, so this helper unpacks it.
+    only need the text, so this helper unpacks it. Plain (text, language) calls
+    are memoized for the session, since many modules restore the same short
+    inputs; calls with segment/boundary kwargs always run uncached.
     """
-    result = _restore_punctuation(text, language, **kwargs)
-    if isinstance(result, tuple):
-        return result[0]
-    return result
+    if kwargs:
+        return _text_only(_restore_punctuation(text, language, **kwargs))
+    return _restore_text_cached(text, language)
+
+
+@pytest.fixture(scope="session")
+def punct_restorer():
+    """Session-scoped handle on the memoized restore_punctuation wrapper.
+
+    Results are cached by (text, language) on first request, so duplicate
+    inputs across parametrized cases are restored once, while an error on one
+    input only fails the test that asked for it (exceptions are not cached).
+    """
+    return restore_punctuation
+
+
+# Marker for tests that need the punctuation model; import it rather than
+# repeating the group name in test modules that opt in explicitly.
+PUNCT_MODEL_GROUP = pytest.mark.xdist_group("punct_model")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Pin tests that use the punctuation model to one pytest-xdist worker.
+
+    Under `pytest -n auto --dist loadgroup`, sharing a group lets those tests
+    reuse one worker's loaded model and memoized results instead of loading the
+    model on every worker. The marker is inert when xdist is not in use.
+    """
+    for item in items:
+        if "punct_restorer" in getattr(item, "fixturenames", ()):
+            item.add_marker(PUNCT_MODEL_GROUP)
 
 
 class MockConfig:
@@ -28,7 +28,6 @@ from __future__ import annotations
 import fnmatch
 import json
 import os
-import sys
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
@@ -36,10 +35,6 @@ from typing import Any
 
 import pytest
 
-# tests/conftest.py already prepends the repo root to sys.path. Keep an extra guard for
-# direct invocations (e.g. `python -m pytest tests/test_audio_fixtures.py`).
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 pytestmark = pytest.mark.transcription
 
 
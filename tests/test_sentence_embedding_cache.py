@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the per-sentence embedding cache shared by the semantic
+question and exclamation checks.
+"""
+
+import numpy as np
+import pytest
+
+import punctuation_restorer
+from punctuation_restorer import _encode_sentence
+
+pytestmark = pytest.mark.core
+
+
+class CountingModel:
+    """Minimal stand-in for SentenceTransformer that counts encode calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, sentences):
+        self.calls += 1
+        return np.array([[float(len(s)), 1.0] for s in sentences])
+
+
+@pytest.fixture
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(punctuation_restorer, "_SENTENCE_EMBEDDINGS", {})
+
+
+def test_repeated_sentence_encoded_once(empty_cache):
+    model = CountingModel()
+    first = _encode_sentence("hola amigos", model)
+    second = _encode_sentence("hola amigos", model)
+    assert model.calls == 1
+    assert second is first
+
+
+def test_cache_is_bounded(empty_cache, monkeypatch):
+    monkeypatch.setattr(punctuation_restorer, "_SENTENCE_EMBEDDINGS_MAX", 2)
+    model = CountingModel()
+    for text in ("uno", "dos", "tres"):
+        _encode_sentence(text, model)
+    assert list(punctuation_restorer._SENTENCE_EMBEDDINGS) == ["dos", "tres"]
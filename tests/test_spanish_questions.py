@@ -4,8 +4,6 @@ Comprehensive test for improved Spanish question detection
 
 import pytest
 
-from conftest import restore_punctuation
-
 pytestmark = pytest.mark.core
 
 
@@ -14,7 +12,7 @@ pytestmark = pytest.mark.core
 # (CLOSED)"). Production relies on Whisper's native punctuation; text-only
 # detection of verb-first questions is inherently ambiguous. Only explicit
 # question-word cases (which work reliably) remain here.
-@pytest.mark.parametrize("text,description", [
+QUESTION_CASES = (
     ("qué hora es la reunión mañana", "Basic question word (qué)"),
     ("cuándo es la cita", "Basic question word (cuándo)"),
     ("cómo estás hoy", "Basic question word (cómo)"),
@@ -27,21 +25,26 @@ pytestmark = pytest.mark.core
     ("cómo está todo", "Question word combination (cómo está)"),
     ("quién puede ayudarme", "Question word combination (quién puede)"),
     ("cuál es tu preferencia", "Question word combination (cuál es)"),
-])
-def test_spanish_question_detected(text, description):
-    """Text expected to be a question should contain '?' in result."""
-    result = restore_punctuation(text, 'es')
-    assert '?' in result, f"{description}: expected question, got {result!r}"
+)
 
-
-@pytest.mark.parametrize("text,description", [
+NON_QUESTION_CASES = (
     ("hola como estás hoy", "Greeting (not a question)"),
     ("gracias por tu ayuda", "Thank you (not a question)"),
     ("el proyecto está terminado", "Statement (not a question)"),
     ("necesito más información", "Statement (not a question)"),
     ("la reunión es mañana", "Statement (not a question)"),
-])
-def test_spanish_non_question_not_detected(text, description):
+)
+
+
+@pytest.mark.parametrize("text,description", QUESTION_CASES)
+def test_spanish_question_detected(punct_restorer, text, description):
+    """Text expected to be a question should contain '?' in result."""
+    result = punct_restorer(text, 'es')
+    assert '?' in result, f"{description}: expected question, got {result!r}"
+
+
+@pytest.mark.parametrize("text,description", NON_QUESTION_CASES)
+def test_spanish_non_question_not_detected(punct_restorer, text, description):
     """Text expected to be a statement should not contain '?' in result."""
-    result = restore_punctuation(text, 'es')
+    result = punct_restorer(text, 'es')
     assert '?' not in result, f"{description}: unexpected question mark in {result!r}"
@@ -5,13 +5,14 @@ Test the specific Spanish "y 184" splitting bug.
 
 import pytest
 
-from conftest import restore_punctuation
+from conftest import PUNCT_MODEL_GROUP
 from punctuation_restorer import _get_language_config, _load_sentence_transformer
 from sentence_splitter import SentenceSplitter
 
 pytestmark = pytest.mark.core
 
 
+@PUNCT_MODEL_GROUP
 def test_spanish_y_number():
     """Test that 'y 184' doesn't get split in Spanish."""
 
@@ -34,25 +35,23 @@ def test_spanish_y_number():
         f"'y 184' not kept together: {sentences}"
 
 
-def test_full_restoration_spanish():
-    """Test full restoration pipeline for Spanish."""
+RESTORATION_CASES = [
+    pytest.param(
+        "Pero si tú quieres escuchar los episodios anteriores, puedes ir al episodio 147, 151, 156, 164, 170, 177 y 184",
+        "y 184",
+        id="episode_list",
+    ),
+    pytest.param("Los episodios son 1, 2, 3 y 4", "3 y 4", id="simple_list"),
+]
 
-    text = "Pero si tú quieres escuchar los episodios anteriores, puedes ir al episodio 147, 151, 156, 164, 170, 177 y 184"
 
-    result = restore_punctuation(text, language='es')
+@pytest.mark.parametrize("text,kept", RESTORATION_CASES)
+def test_restoration_keeps_number_list(punct_restorer, text, kept):
+    """Test the full restoration pipeline keeps a Spanish 'y <number>' list together."""
+    result = punct_restorer(text, 'es')
 
-    if "y." in result and "184" in result:
-        assert "y. 184" not in result and "y.\n184" not in result, \
-            f"'y' and '184' were split: {result}"
+    last_number = kept.rsplit(" ", 1)[-1]
+    assert f"y. {last_number}" not in result and f"y.\n{last_number}" not in result, \
+        f"'y' and '{last_number}' were split: {result}"
 
-    assert "y 184" in result or "177 y 184" in result, \
-        f"Number list not preserved: {result}"
-
-
-def test_simple_spanish_list():
-    """Test simple Spanish number list."""
-    text = "Los episodios son 1, 2, 3 y 4"
-
-    result = restore_punctuation(text, language='es')
-
-    assert "3 y 4" in result, f"Simple list broken: {result}"
+    assert kept in result, f"Number list not preserved: {result}"
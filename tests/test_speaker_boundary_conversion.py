@@ -65,6 +65,21 @@ class TestSpeakerBoundaryConversion:
         assert len(result) == 1
         assert result[0] == 5
 
+    def test_boundary_before_first_segment(self):
+        """Test boundary before any segment maps to the end of the first segment."""
+        whisper_segments = [
+            {'start': 3.0, 'end': 5.0, 'text': 'First'},
+            {'start': 5.0, 'end': 9.0, 'text': 'Second'},
+        ]
+        text = "First Second"
+
+        speaker_boundaries = [1.0]
+        result = _convert_speaker_timestamps_to_char_positions(
+            speaker_boundaries, whisper_segments, text
+        )
+
+        assert result == [5]
+
     def test_multiple_boundaries(self):
         """Test conversion of multiple speaker boundaries."""
         whisper_segments = [
@@ -83,6 +98,15 @@ class TestSpeakerBoundaryConversion:
         assert result[0] == 11
         assert result[1] == 23
 
+    def test_text_argument_optional(self):
+        """Test positions are derived from segments alone when text is omitted."""
+        whisper_segments = [
+            {'start': 0.0, 'end': 5.0, 'text': 'Hello world'},
+            {'start': 5.0, 'end': 10.0, 'text': 'How are you'},
+        ]
+
+        assert _convert_speaker_timestamps_to_char_positions([5.0], whisper_segments) == [11]
+
     def test_empty_inputs(self):
         """Test with empty inputs."""
         assert _convert_speaker_timestamps_to_char_positions([], [], "") == []
@@ -123,11 +147,9 @@ class TestSpeakerBoundaryConversion:
 
         assert len(result) == 1
 
-        expected_pos = 0
-        for i, seg in enumerate(whisper_segments[:5]):
-            expected_pos += len(seg['text'])
-            if i < 4:
-                expected_pos += 1
+        # Boundary falls within segment 5, so it maps to that segment's end in the space-joined text
+        first5 = whisper_segments[:5]
+        expected_pos = sum(len(seg['text']) for seg in first5) + len(first5) - 1
 
         assert result[0] == expected_pos, f"Expected {expected_pos}, got {result[0]}"
 
@@ -7,8 +7,6 @@ the sentence splitting logic without requiring actual audio files or
 diarization models.
 """
 
-import unittest
-
 import pytest
 
 from speaker_diarization import _merge_boundaries
@@ -16,7 +14,7 @@ from speaker_diarization import _merge_boundaries
 pytestmark = pytest.mark.core
 
 
-class TestBoundaryMergingIntegration(unittest.TestCase):
+class TestBoundaryMergingIntegration:
     """Test boundary merging scenarios that occur in real transcription."""
     
     def test_typical_conversation_scenario(self):
@@ -29,8 +27,8 @@ class TestBoundaryMergingIntegration(unittest.TestCase):
         result = _merge_boundaries(whisper_boundaries, speaker_boundaries)
         
         # Should have all boundaries, with close ones deduplicated
-        self.assertGreater(len(result), 0)
-        self.assertTrue(all(result[i] < result[i+1] for i in range(len(result)-1)))  # Sorted
+        assert len(result) > 0
+        assert all(result[i] < result[i+1] for i in range(len(result)-1))  # Sorted
     
     def test_interview_scenario(self):
         """Test interview with many back-and-forth exchanges."""
@@ -41,8 +39,8 @@ class TestBoundaryMergingIntegration(unittest.TestCase):
         result = _merge_boundaries(whisper_boundaries, speaker_boundaries, epsilon=1.0)
         
         # Many boundaries should be deduplicated due to proximity
-        self.assertLessEqual(len(result), len(whisper_boundaries) + len(speaker_boundaries))
-        self.assertTrue(all(result[i] < result[i+1] for i in range(len(result)-1)))
+        assert len(result) <= len(whisper_boundaries) + len(speaker_boundaries)
+        assert all(result[i] < result[i+1] for i in range(len(result)-1))
     
     def test_monologue_with_speaker_detection(self):
         """Test monologue where speaker doesn't change."""
@@ -52,7 +50,7 @@ class TestBoundaryMergingIntegration(unittest.TestCase):
         result = _merge_boundaries(whisper_boundaries, speaker_boundaries)
         
         # Should just return Whisper boundaries
-        self.assertEqual(result, whisper_boundaries)
+        assert result == whisper_boundaries
     
     def test_single_speaker_multiple_pauses(self):
         """Test single speaker with natural pauses."""
@@ -61,12 +59,12 @@ class TestBoundaryMergingIntegration(unittest.TestCase):
         
         result = _merge_boundaries(whisper_boundaries, speaker_boundaries)
         
-        self.assertEqual(result, whisper_boundaries)
+        assert result == whisper_boundaries
     
     def test_no_boundaries_at_all(self):
         """Test when neither Whisper nor speaker detection finds boundaries."""
         result = _merge_boundaries([], [])
-        self.assertEqual(result, [])
+        assert result == []
     
     def test_speaker_boundaries_without_whisper(self):
         """Test when only speaker boundaries are available."""
@@ -77,10 +75,10 @@ class TestBoundaryMergingIntegration(unittest.TestCase):
         
         result = _merge_boundaries(whisper_boundaries, speaker_boundaries)
         
-        self.assertEqual(result, speaker_boundaries)
+        assert result == speaker_boundaries
 
 
-class TestBoundaryTimingEdgeCases(unittest.TestCase):
+class TestBoundaryTimingEdgeCases:
     """Test edge cases in boundary timing."""
     
     def test_simultaneous_boundaries(self):
@@ -91,7 +89,7 @@ class TestBoundaryTimingEdgeCases(unittest.TestCase):
         result = _merge_boundaries(whisper_boundaries, speaker_boundaries, epsilon=0.1)
         
         # Should deduplicate exact matches
-        self.assertEqual(result, [10.0, 20.0])
+        assert result == [10.0, 20.0]
     
     def test_very_close_boundaries(self):
         """Test boundaries that are very close together."""
@@ -101,7 +99,7 @@ class TestBoundaryTimingEdgeCases(unittest.TestCase):
         result = _merge_boundaries(whisper_boundaries, speaker_boundaries, epsilon=1.0)
         
         # Should keep only one due to deduplication
-        self.assertEqual(len(result), 1)
+        assert len(result) == 1
     
     def test_boundaries_at_start_and_end(self):
         """Test boundaries at beginning and end of audio."""
@@ -111,9 +109,9 @@ class TestBoundaryTimingEdgeCases(unittest.TestCase):
         result = _merge_boundaries(whisper_boundaries, speaker_boundaries, epsilon=1.0)
         
         # First and last should be deduplicated
-        self.assertGreater(len(result), 0)
-        self.assertTrue(result[0] <= 1.0)  # First boundary should be early
-        self.assertTrue(result[-1] >= 99.0)  # Last boundary should be late
+        assert len(result) > 0
+        assert result[0] <= 1.0  # First boundary should be early
+        assert result[-1] >= 99.0  # Last boundary should be late
     
     def test_negative_boundaries(self):
         """Test that function handles potential negative times."""
@@ -123,10 +121,10 @@ class TestBoundaryTimingEdgeCases(unittest.TestCase):
         result = _merge_boundaries(whisper_boundaries, speaker_boundaries, epsilon=1.0)
         
         # Should still produce valid sorted output
-        self.assertTrue(all(result[i] < result[i+1] for i in range(len(result)-1)))
+        assert all(result[i] < result[i+1] for i in range(len(result)-1))
 
 
-class TestMergeBehaviorConsistency(unittest.TestCase):
+class TestMergeBehaviorConsistency:
     """Test that merge behavior is consistent and predictable."""
     
     def test_merge_is_deterministic(self):
@@ -137,7 +135,7 @@ class TestMergeBehaviorConsistency(unittest.TestCase):
         result1 = _merge_boundaries(whisper, speaker)
         result2 = _merge_boundaries(whisper, speaker)
         
-        self.assertEqual(result1, result2)
+        assert result1 == result2
     
     def test_order_independence(self):
         """Test that input order doesn't affect output."""
@@ -147,7 +145,7 @@ class TestMergeBehaviorConsistency(unittest.TestCase):
         result = _merge_boundaries(whisper, speaker)
         
         # Output should always be sorted
-        self.assertEqual(result, sorted(result))
+        assert result == sorted(result)
     
     def test_duplicate_inputs_handled(self):
         """Test that duplicate boundaries in input are handled."""
@@ -157,7 +155,7 @@ class TestMergeBehaviorConsistency(unittest.TestCase):
         result = _merge_boundaries(whisper, speaker)
         
         # Duplicates should be removed during merge
-        self.assertEqual(len(result), 3)  # 10.0, 15.0, 20.0
-        self.assertEqual(result, [10.0, 15.0, 20.0])
+        assert len(result) == 3  # 10.0, 15.0, 20.0
+        assert result == [10.0, 15.0, 20.0]
 
 
@@ -6,8 +6,6 @@ Tests the core functions of speaker_diarization.py without requiring
 actual audio files or models.
 """
 
-import unittest
-
 import pytest
 
 from speaker_diarization import (
@@ -21,13 +19,13 @@ from speaker_diarization import (
 pytestmark = pytest.mark.core
 
 
-class TestExtractSpeakerBoundaries(unittest.TestCase):
+class TestExtractSpeakerBoundaries:
     """Test extraction of speaker boundaries from segments."""
     
     def test_empty_segments(self):
         """Empty segments should return empty boundaries."""
         boundaries, details = _extract_speaker_boundaries([])
-        self.assertEqual(boundaries, [])
+        assert boundaries == []
     
     def test_single_segment(self):
         """Single segment should have no boundaries."""
@@ -35,7 +33,7 @@ class TestExtractSpeakerBoundaries(unittest.TestCase):
             {"start": 0.0, "end": 10.0, "speaker": "SPEAKER_00"}
         ]
         boundaries, details = _extract_speaker_boundaries(segments)
-        self.assertEqual(boundaries, [])
+        assert boundaries == []
     
     def test_same_speaker_no_boundary(self):
         """Segments with same speaker should not create boundaries."""
@@ -45,7 +43,7 @@ class TestExtractSpeakerBoundaries(unittest.TestCase):
             {"start": 20.0, "end": 30.0, "speaker": "SPEAKER_00"}
         ]
         boundaries, details = _extract_speaker_boundaries(segments)
-        self.assertEqual(boundaries, [])
+        assert boundaries == []
     
     def test_speaker_change_creates_boundary(self):
         """Speaker change should create boundary at end of first segment."""
@@ -54,7 +52,7 @@ class TestExtractSpeakerBoundaries(unittest.TestCase):
             {"start": 10.0, "end": 20.0, "speaker": "SPEAKER_01"}
         ]
         boundaries, details = _extract_speaker_boundaries(segments)
-        self.assertEqual(boundaries, [10.0])
+        assert boundaries == [10.0]
     
     def test_multiple_speaker_changes(self):
         """Multiple speaker changes should create multiple boundaries."""
@@ -65,7 +63,7 @@ class TestExtractSpeakerBoundaries(unittest.TestCase):
             {"start": 25.0, "end": 35.0, "speaker": "SPEAKER_02"}
         ]
         boundaries, details = _extract_speaker_boundaries(segments)
-        self.assertEqual(boundaries, [10.0, 15.0, 25.0])
+        assert boundaries == [10.0, 15.0, 25.0]
     
     def test_short_segments_filtered(self):
         """Very short segments (< MIN_SPEAKER_SEGMENT_SEC=0.5s) should be filtered."""
@@ -75,7 +73,7 @@ class TestExtractSpeakerBoundaries(unittest.TestCase):
             {"start": 4.0, "end": 4.4, "speaker": "SPEAKER_00"}   # Too short (0.4s < 0.5s)
         ]
         boundaries, details = _extract_speaker_boundaries(segments)
-        self.assertEqual(boundaries, [4.0])
+        assert boundaries == [4.0]
     
     def test_unsorted_segments(self):
         """Unsorted segments should be sorted before processing."""
@@ -85,63 +83,39 @@ class TestExtractSpeakerBoundaries(unittest.TestCase):
             {"start": 10.0, "end": 20.0, "speaker": "SPEAKER_01"}
         ]
         boundaries, details = _extract_speaker_boundaries(segments)
-        self.assertEqual(boundaries, [10.0])
+        assert boundaries == [10.0]
+
 
+MERGE_CASES = [
+    # Both None should return empty list
+    pytest.param(None, None, SPEAKER_BOUNDARY_EPSILON_SEC, [], id="both_none"),
+    # Only Whisper boundaries should be returned sorted
+    pytest.param([15.0, 5.0, 10.0], None, SPEAKER_BOUNDARY_EPSILON_SEC, [5.0, 10.0, 15.0], id="whisper_only"),
+    # Only speaker boundaries should be returned sorted
+    pytest.param(None, [20.0, 10.0, 30.0], SPEAKER_BOUNDARY_EPSILON_SEC, [10.0, 20.0, 30.0], id="speaker_only"),
+    # Non-overlapping boundaries should all be included
+    pytest.param(
+        [5.0, 15.0, 25.0], [10.0, 20.0, 30.0], SPEAKER_BOUNDARY_EPSILON_SEC,
+        [5.0, 10.0, 15.0, 20.0, 25.0, 30.0], id="no_overlap_merge",
+    ),
+    # Boundaries within epsilon should be deduplicated, keeping the first in each cluster
+    pytest.param([10.0, 20.0], [10.5, 20.8], 1.0, [10.0, 20.0], id="deduplication_within_epsilon"),
+    # Speaker boundary sorts first, so it is the one kept
+    pytest.param([10.5], [10.0], 1.0, [10.0], id="deduplication_keeps_first"),
+    # Custom epsilon should be respected (boundaries 0.3s apart)
+    pytest.param([10.0], [10.3], 0.5, [10.0], id="custom_epsilon_dedupes"),
+    pytest.param([10.0], [10.3], 0.2, [10.0, 10.3], id="custom_epsilon_keeps_both"),
+    # Empty boundary lists should be handled
+    pytest.param([], [], SPEAKER_BOUNDARY_EPSILON_SEC, [], id="empty_boundaries"),
+]
 
-class TestMergeBoundaries(unittest.TestCase):
+
+class TestMergeBoundaries:
     """Test merging of Whisper and speaker boundaries."""
     
-    def test_both_none(self):
-        """Both None should return empty list."""
-        result = _merge_boundaries(None, None)
-        self.assertEqual(result, [])
-    
-    def test_whisper_only(self):
-        """Only Whisper boundaries should be returned sorted."""
-        whisper = [15.0, 5.0, 10.0]
-        result = _merge_boundaries(whisper, None)
-        self.assertEqual(result, [5.0, 10.0, 15.0])
-    
-    def test_speaker_only(self):
-        """Only speaker boundaries should be returned sorted."""
-        speaker = [20.0, 10.0, 30.0]
-        result = _merge_boundaries(None, speaker)
-        self.assertEqual(result, [10.0, 20.0, 30.0])
-    
-    def test_no_overlap_merge(self):
-        """Non-overlapping boundaries should all be included."""
-        whisper = [5.0, 15.0, 25.0]
-        speaker = [10.0, 20.0, 30.0]
-        result = _merge_boundaries(whisper, speaker)
-        self.assertEqual(result, [5.0, 10.0, 15.0, 20.0, 25.0, 30.0])
-    
-    def test_deduplication_within_epsilon(self):
-        """Boundaries within epsilon should be deduplicated."""
-        # Default epsilon is 1.0 second
-        whisper = [10.0, 20.0]
-        speaker = [10.5, 20.8]  # Within 1s of whisper boundaries
-        result = _merge_boundaries(whisper, speaker, epsilon=1.0)
-        # Should keep only the first in each cluster
-        self.assertEqual(result, [10.0, 20.0])
-    
-    def test_deduplication_keeps_first(self):
-        """Deduplication should keep first boundary in cluster."""
-        whisper = [10.5]
-        speaker = [10.0]  # Speaker comes first when sorted
-        result = _merge_boundaries(whisper, speaker, epsilon=1.0)
-        # Should keep 10.0 (speaker) as it comes first
-        self.assertEqual(result, [10.0])
-    
-    def test_custom_epsilon(self):
-        """Custom epsilon should be respected."""
-        whisper = [10.0]
-        speaker = [10.3]  # 0.3s apart
-        # With epsilon=0.5, should deduplicate
-        result1 = _merge_boundaries(whisper, speaker, epsilon=0.5)
-        self.assertEqual(result1, [10.0])
-        # With epsilon=0.2, should keep both
-        result2 = _merge_boundaries(whisper, speaker, epsilon=0.2)
-        self.assertEqual(result2, [10.0, 10.3])
+    @pytest.mark.parametrize("whisper,speaker,epsilon,expected", MERGE_CASES)
+    def test_merge_boundaries(self, whisper, speaker, epsilon, expected):
+        assert _merge_boundaries(whisper, speaker, epsilon=epsilon) == expected
     
     def test_multiple_clusters(self):
         """Multiple boundary clusters should each be deduplicated."""
@@ -149,17 +123,12 @@ class TestMergeBoundaries(unittest.TestCase):
         speaker = [5.2, 15.4]
         result = _merge_boundaries(whisper, speaker, epsilon=1.0)
         # Each cluster should reduce to one boundary
-        self.assertEqual(len(result), 2)
-        self.assertIn(5.0, result)  # First of first cluster
-        self.assertIn(15.0, result)  # First of second cluster
-    
-    def test_empty_boundaries(self):
-        """Empty boundary lists should be handled."""
-        result = _merge_boundaries([], [])
-        self.assertEqual(result, [])
+        assert len(result) == 2
+        assert 5.0 in result  # First of first cluster
+        assert 15.0 in result  # First of second cluster
 
 
-class TestBoundaryPriority(unittest.TestCase):
+class TestBoundaryPriority:
     """Test that speaker boundaries have higher priority in merging."""
     
     def test_speaker_priority_when_close(self):
@@ -169,14 +138,14 @@ class TestBoundaryPriority(unittest.TestCase):
         speaker = [10.2]  # Very close to whisper
         result = _merge_boundaries(whisper, speaker, epsilon=0.5)
         # Should keep only one, and it should be the first when sorted
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0], 10.0)
+        assert len(result) == 1
+        assert result[0] == 10.0
     
     def test_both_boundaries_far_apart(self):
         """When boundaries are far apart, both should be kept."""
         whisper = [10.0]
         speaker = [15.0]  # Far from whisper
         result = _merge_boundaries(whisper, speaker, epsilon=1.0)
-        self.assertEqual(result, [10.0, 15.0])
+        assert result == [10.0, 15.0]
 
 
@@ -4,8 +4,6 @@ Focused test for the four specific Spanish transcription bugs mentioned by the u
 
 import pytest
 
-from conftest import restore_punctuation
-
 pytestmark = pytest.mark.core
 
 
@@ -15,9 +13,9 @@ pytestmark = pytest.mark.core
     "También sí",
     "Es el que le dice al empleado que ya no va a trabajar más",
 ])
-def test_bug1_missing_end_punctuation(text):
+def test_bug1_missing_end_punctuation(punct_restorer, text):
     """Bug 1: Sentences must end with proper punctuation."""
-    result = restore_punctuation(text, 'es')
+    result = punct_restorer(text, 'es')
     assert result[-1] in '.?!', f"Missing end punctuation: {result!r}"
 
 
@@ -26,30 +24,30 @@ def test_bug1_missing_end_punctuation(text):
     "También sí,",
     "Es el que le dice al empleado que ya no va a trabajar más,",
 ])
-def test_bug2_trailing_commas(text):
+def test_bug2_trailing_commas(punct_restorer, text):
     """Bug 2: Sentences must not end with a trailing comma."""
-    result = restore_punctuation(text, 'es')
+    result = punct_restorer(text, 'es')
     assert not result.rstrip().endswith(','), f"Trailing comma: {result!r}"
 
 
 @pytest.mark.parametrize("text", [
     "Despidan a los empleados por los siguientes dos o tres meses, ¿no",
 ])
-def test_bug3_inverted_question_marks_mid_sentence(text):
+def test_bug3_inverted_question_marks_mid_sentence(punct_restorer, text):
     """Bug 3: Inverted question marks should not appear fused to preceding punctuation."""
-    result = restore_punctuation(text, 'es')
+    result = punct_restorer(text, 'es')
     assert result[-1] in '.?!', f"Missing end punctuation: {result!r}"
     assert '.¿' not in result, f"Period immediately followed by ¿: {result!r}"
     assert '?¿' not in result, f"? immediately followed by ¿: {result!r}"
 
 
-def test_bug4_question_mark_after_period():
+def test_bug4_question_mark_after_period(punct_restorer):
     """Bug 4: '.?¿' sequences should be cleaned up."""
     text = (
         "Vamos a levantar de esto, vamos a salir de esto, tenemos que "
         "reconocer.?¿La realidad, estar conscientes de qué está pasando "
         "alrededor de nosotros, ser conscientes de que sí"
     )
-    result = restore_punctuation(text, 'es')
+    result = punct_restorer(text, 'es')
     assert '.?¿' not in result, f"Found .?¿ sequence: {result!r}"
     assert result[-1] in '.?!', f"Missing end punctuation: {result!r}"
@@ -7,20 +7,15 @@ from podscripter import _normalize_srt_cues
 pytestmark = pytest.mark.core
 
 
-def assert_float_close(a, b, tol=1e-6):
-    if abs(a - b) > tol:
-        raise AssertionError(f"Expected {b} but got {a}")
-
-
 def test_trims_to_next_start_minus_gap():
     segs = [
         {"start": 0.0, "end": 10.0, "text": "Hello world this is a longer text segment for testing trimming"},
         {"start": 3.0, "end": 4.0, "text": "world"},
     ]
     out = _normalize_srt_cues(segs, max_duration=6.0, min_gap=0.2, min_duration=1.0)
-    assert_float_close(out[0]["end"], 2.8)
-    assert_float_close(out[1]["start"], 3.0)
-    assert_float_close(out[1]["end"], 4.0)
+    assert out[0]["end"] == pytest.approx(2.8, abs=1e-6)
+    assert out[1]["start"] == pytest.approx(3.0, abs=1e-6)
+    assert out[1]["end"] == pytest.approx(4.0, abs=1e-6)
 
 
 def test_max_duration_clamp():
@@ -32,7 +27,7 @@ def test_max_duration_clamp():
 def test_min_duration_enforced():
     segs = [{"start": 1.0, "end": 1.0, "text": "Zero length"}]
     out = _normalize_srt_cues(segs, max_duration=4.5, min_gap=0.25, min_duration=1.5)
-    assert_float_close(out[0]["end"], 2.5)  # start + min_duration
+    assert out[0]["end"] == pytest.approx(2.5, abs=1e-6)  # start + min_duration
 
 
 def test_reading_time_shortens_long_silence_tail():
@@ -41,6 +36,6 @@ def test_reading_time_shortens_long_silence_tail():
     segs = [{"start": 0.0, "end": 15.0, "text": text}]
     out = _normalize_srt_cues(segs, max_duration=4.5, min_gap=0.25, min_duration=1.5, chars_per_second=15.0)
     expected = min(4.5, max(1.5, len(text) / 15.0))
-    assert_float_close(out[0]["end"] - 0.0, expected, tol=0.25)
+    assert out[0]["end"] - 0.0 == pytest.approx(expected, abs=0.25)
 
 
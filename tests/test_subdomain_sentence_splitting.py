@@ -10,39 +10,38 @@ Fix: Enhanced domain masking to handle subdomain patterns before space insertion
 """
 
 import pytest
-from conftest import restore_punctuation
 from domain_utils import mask_domains, unmask_domains
 
 pytestmark = pytest.mark.core
 
 
-def test_subdomain_sentence_splitting():
+SPLIT_DOMAIN_PATTERNS = [
+    ". com", ". org", ". net", ". co.uk", ". com.br",
+    "www. ", "blog. ", "ftp. ", "api. ", "cdn. ",
+]
+
+
+@pytest.mark.parametrize("original", [
+    "Visit www.google.com for search",
+    "Go to blog.example.org please",
+    "Check ftp.downloads.net today",
+    "Ve a espanolistos.com ahora",
+    "Visita www.espanolistos.com por favor",
+    "Visit mail.company.co.uk",
+    "Check api.service.com",
+    "Go to cdn.assets.net",
+    "Visit help.support.org",
+    "Visit www.google.com and then espanolistos.com",
+])
+def test_subdomain_sentence_splitting(punct_restorer, original):
     """Test that subdomain patterns are not split during sentence processing."""
+    result = punct_restorer(original, language='es')
 
-    test_cases = [
-        ("Visit www.google.com for search", "Visit www.google.com for search."),
-        ("Go to blog.example.org please", "Go to blog.example.org please."),
-        ("Check ftp.downloads.net today", "Check ftp.downloads.net today."),
-        ("Ve a espanolistos.com ahora", "Ve a espanolistos.com ahora."),
-        ("Visita www.espanolistos.com por favor", "Visita www.espanolistos.com por favor."),
-        ("Visit mail.company.co.uk", "Visit mail.company.co.uk."),
-        ("Check api.service.com", "Check api.service.com."),
-        ("Go to cdn.assets.net", "Go to cdn.assets.net."),
-        ("Visit help.support.org", "Visit help.support.org."),
-        ("Visit www.google.com and then espanolistos.com", "Visit www.google.com and then espanolistos.com."),
-    ]
-
-    for original, expected in test_cases:
-        result = restore_punctuation(original, language='es')
+    has_split_domain = any(pattern in result for pattern in SPLIT_DOMAIN_PATTERNS)
 
-        has_split_domain = any(pattern in result for pattern in [
-            ". com", ". org", ". net", ". co.uk", ". com.br",
-            "www. ", "blog. ", "ftp. ", "api. ", "cdn. "
-        ])
-
-        assert not has_split_domain, (
-            f"Domain split detected for '{original}': got '{result}'"
-        )
+    assert not has_split_domain, (
+        f"Domain split detected for '{original}': got '{result}'"
+    )
 
 
 def test_subdomain_masking():
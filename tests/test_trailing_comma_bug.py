@@ -10,16 +10,19 @@ Was producing: "...o no, ?"
 Should produce: "...o no?"  or "...o no."
 """
 
-import unittest
-
 import pytest
 
-from punctuation_restorer import restore_punctuation
+from conftest import PUNCT_MODEL_GROUP
+from punctuation_restorer import (
+    _apply_semantic_punctuation,
+    _load_sentence_transformer,
+    restore_punctuation,
+)
 
-pytestmark = pytest.mark.core
+pytestmark = [pytest.mark.core, PUNCT_MODEL_GROUP]
 
 
-class TestTrailingCommaBug(unittest.TestCase):
+class TestTrailingCommaBug:
     """Test that trailing commas are stripped before adding terminal punctuation."""
     
     def test_spanish_trailing_comma_with_question_words(self):
@@ -30,16 +33,14 @@ class TestTrailingCommaBug(unittest.TestCase):
         processed, sentences = restore_punctuation(text, 'es')
         
         # Should not have ", ?" anywhere
-        self.assertNotIn(', ?', processed, 
-                        "Should not have comma followed by question mark")
+        assert ', ?' not in processed, "Should not have comma followed by question mark"
         
         # Should not have ", ?" in any sentence
         for sentence in sentences:
             s = sentence.text if hasattr(sentence, 'text') else sentence
-            self.assertNotIn(', ?', s,
-                           f"Sentence should not contain ', ?': {s}")
-            self.assertTrue(s.rstrip().endswith(('.', '!', '?')),
-                          f"Sentence should end with terminal punctuation: {s}")
+            assert ', ?' not in s, f"Sentence should not contain ', ?': {s}"
+            assert s.rstrip().endswith(('.', '!', '?')), \
+                f"Sentence should end with terminal punctuation: {s}"
     
     def test_spanish_trailing_comma_no_question_words(self):
         """Test trailing comma is removed even without question words."""
@@ -49,12 +50,10 @@ class TestTrailingCommaBug(unittest.TestCase):
         processed, sentences = restore_punctuation(text, 'es')
         
         # Should not have trailing comma
-        self.assertFalse(processed.rstrip().endswith(','),
-                        "Should not end with comma")
+        assert not processed.rstrip().endswith(','), "Should not end with comma"
         
         # Should end with period
-        self.assertTrue(processed.rstrip().endswith('.'),
-                       "Should end with period")
+        assert processed.rstrip().endswith('.'), "Should end with period"
     
     def test_spanish_trailing_semicolon(self):
         """Test that other trailing punctuation is also removed."""
@@ -63,8 +62,7 @@ class TestTrailingCommaBug(unittest.TestCase):
         processed, sentences = restore_punctuation(text, 'es')
         
         # Should not have trailing semicolon
-        self.assertFalse(processed.rstrip().endswith(';'),
-                        "Should not end with semicolon")
+        assert not processed.rstrip().endswith(';'), "Should not end with semicolon"
     
     def test_spanish_already_has_period(self):
         """Test that sentences with proper punctuation are not modified."""
@@ -73,15 +71,19 @@ class TestTrailingCommaBug(unittest.TestCase):
         processed, sentences = restore_punctuation(text, 'es')
         
         # Should still end with period
-        self.assertTrue(processed.rstrip().endswith('.'),
-                       "Should still end with period")
+        assert processed.rstrip().endswith('.'), "Should still end with period"
         
         # Should not have duplicates
-        self.assertNotIn('..', processed,
-                        "Should not have double periods")
+        assert '..' not in processed, "Should not have double periods"
+
 
+@pytest.fixture(scope="module")
+def semantic_model():
+    """Sentence embedding model shared by the semantic punctuation tests."""
+    return _load_sentence_transformer()
 
-class TestApplySemanticPunctuationTrailingComma(unittest.TestCase):
+
+class TestApplySemanticPunctuationTrailingComma:
     """
     Test that _apply_semantic_punctuation strips trailing commas before
     appending terminal punctuation.
@@ -95,65 +97,38 @@ class TestApplySemanticPunctuationTrailingComma(unittest.TestCase):
     Found in Episodio270.txt (line 103) when running with --enable-diarization.
     """
 
-    @classmethod
-    def setUpClass(cls):
-        from punctuation_restorer import _load_sentence_transformer
-        cls.model = _load_sentence_transformer(
-            'sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2'
-        )
-
-    def _apply(self, text, language='es'):
-        from punctuation_restorer import _apply_semantic_punctuation
-        return _apply_semantic_punctuation(text, self.model, language, 0, 1)
-
-    def test_spanish_bueno_with_trailing_comma(self):
+    def test_spanish_bueno_with_trailing_comma(self, semantic_model):
         """The exact regression case: "Bueno," must not become "Bueno,!"."""
-        out = self._apply("Bueno,", 'es')
-        self.assertNotIn(',!', out, f"Should not contain ',!' artifact: {out!r}")
-        self.assertNotIn(',?', out, f"Should not contain ',?' artifact: {out!r}")
-        self.assertNotIn(',.', out, f"Should not contain ',.' artifact: {out!r}")
-        self.assertTrue(
-            out.endswith(('.', '!', '?')),
-            f"Should end with terminal punctuation: {out!r}",
-        )
+        out = _apply_semantic_punctuation("Bueno,", semantic_model, 'es', 0, 1)
+        assert ',!' not in out, f"Should not contain ',!' artifact: {out!r}"
+        assert ',?' not in out, f"Should not contain ',?' artifact: {out!r}"
+        assert ',.' not in out, f"Should not contain ',.' artifact: {out!r}"
+        assert out.endswith(('.', '!', '?')), \
+            f"Should end with terminal punctuation: {out!r}"
         # Stripped comma + terminal punctuation: "Bueno!" / "Bueno." / "Bueno?"
-        self.assertEqual(out.rstrip('.!?'), 'Bueno', f"Unexpected body: {out!r}")
+        assert out.rstrip('.!?') == 'Bueno', f"Unexpected body: {out!r}"
 
-    def test_no_dangling_punct_before_terminal_es(self):
+    @pytest.mark.parametrize("text", ["Bueno,", "Hola,", "Sin embargo,", "O sea,", "Pues bien;", "Listo:"])
+    def test_no_dangling_punct_before_terminal_es(self, semantic_model, text):
         """Multiple Spanish fragments with trailing commas/semicolons/colons."""
-        cases = ["Bueno,", "Hola,", "Sin embargo,", "O sea,", "Pues bien;", "Listo:"]
-        for text in cases:
-            with self.subTest(text=text):
-                out = self._apply(text, 'es')
-                self.assertNotIn(',!', out, f"{text!r} -> {out!r}")
-                self.assertNotIn(',?', out, f"{text!r} -> {out!r}")
-                self.assertNotIn(';!', out, f"{text!r} -> {out!r}")
-                self.assertNotIn(';?', out, f"{text!r} -> {out!r}")
-                self.assertNotIn(':!', out, f"{text!r} -> {out!r}")
-                self.assertNotIn(':?', out, f"{text!r} -> {out!r}")
-                self.assertTrue(
-                    out.endswith(('.', '!', '?')),
-                    f"Should end with terminal punctuation: {out!r}",
-                )
-
-    def test_no_dangling_punct_before_terminal_multilingual(self):
+        out = _apply_semantic_punctuation(text, semantic_model, 'es', 0, 1)
+        for artifact in (',!', ',?', ';!', ';?', ':!', ':?'):
+            assert artifact not in out, f"{text!r} -> {out!r}"
+        assert out.endswith(('.', '!', '?')), \
+            f"Should end with terminal punctuation: {out!r}"
+
+    @pytest.mark.parametrize("lang,text", [
+        ('en', "Well,"),
+        ('en', "Hello,"),
+        ('fr', "Bon,"),
+        ('fr', "Bonjour,"),
+        ('de', "Gut,"),
+        ('de', "Hallo,"),
+    ])
+    def test_no_dangling_punct_before_terminal_multilingual(self, semantic_model, lang, text):
         """Same guarantee should hold for the other primary languages."""
-        cases = [
-            ('en', "Well,"),
-            ('en', "Hello,"),
-            ('fr', "Bon,"),
-            ('fr', "Bonjour,"),
-            ('de', "Gut,"),
-            ('de', "Hallo,"),
-        ]
-        for lang, text in cases:
-            with self.subTest(lang=lang, text=text):
-                out = self._apply(text, lang)
-                self.assertNotIn(',!', out, f"[{lang}] {text!r} -> {out!r}")
-                self.assertNotIn(',?', out, f"[{lang}] {text!r} -> {out!r}")
-                self.assertTrue(
-                    out.endswith(('.', '!', '?')),
-                    f"[{lang}] Should end with terminal punctuation: {out!r}",
-                )
-
-
+        out = _apply_semantic_punctuation(text, semantic_model, lang, 0, 1)
+        assert ',!' not in out, f"[{lang}] {text!r} -> {out!r}"
+        assert ',?' not in out, f"[{lang}] {text!r} -> {out!r}"
+        assert out.endswith(('.', '!', '?')), \
+            f"[{lang}] Should end with terminal punctuation: {out!r}"
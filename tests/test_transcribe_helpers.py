@@ -7,36 +7,42 @@ Tests:
 - _dedupe_segments and _accumulate_segments logic
 """
 
+import wave
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import pytest
 import podscripter as ts
-from pydub import AudioSegment
 
 pytestmark = pytest.mark.core
 
 
-def test_split_audio_with_overlap_silence():
-    with TemporaryDirectory() as tmp:
-        tmpdir = Path(tmp)
-        media = tmpdir / "synthetic_silence.wav"
-        AudioSegment.silent(duration=10_000).export(str(media), format="wav")
+@pytest.fixture(scope="session")
+def silence_wav(tmp_path_factory):
+    """10 s of 16 kHz mono silence, written directly as PCM (no ffmpeg)."""
+    media = tmp_path_factory.mktemp("audio") / "synthetic_silence.wav"
+    with wave.open(str(media), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(16_000)
+        w.writeframes(bytes(2 * 16_000 * 10))
+    return media
 
-        chunks = ts._split_audio_with_overlap(
-            str(media), chunk_length_sec=4, overlap_sec=1, chunk_dir=tmpdir
-        )
-        assert len(chunks) in (3, 4)
-        durations = [round(c["duration_sec"], 2) for c in chunks]
-        assert durations[0] == 4.0
-        assert durations[1] == 4.0
-        assert 3.9 <= durations[2] <= 4.1
-        if len(chunks) == 4:
-            assert 0.8 <= durations[3] <= 1.2
-        for c in chunks:
-            p = Path(c["path"])
-            assert p.exists()
-            p.unlink()
+
+def test_split_audio_with_overlap_silence(silence_wav, tmp_path):
+    chunks = ts._split_audio_with_overlap(
+        str(silence_wav), chunk_length_sec=4, overlap_sec=1, chunk_dir=tmp_path
+    )
+    assert len(chunks) in (3, 4)
+    durations = [round(c["duration_sec"], 2) for c in chunks]
+    assert durations[0] == 4.0
+    assert durations[1] == 4.0
+    assert 3.9 <= durations[2] <= 4.1
+    if len(chunks) == 4:
+        assert 0.8 <= durations[3] <= 1.2
+    for c in chunks:
+        p = Path(c["path"])
+        assert p.exists()
+        p.unlink()
 
 
 def test_dedupe_segments_basic():
@@ -6,12 +6,14 @@ import re
 
 import pytest
 
-from conftest import restore_punctuation
-
 pytestmark = pytest.mark.transcription
 
+# (sentence text, trailing punctuation run) pairs, as produced by re.split on [.!?]+
+_SENTENCE_RE = re.compile(r'([^.!?]*)([.!?]*)')
+_LEADING_JUNK_RE = re.compile(r'^[",\s]+')
+
 
-def test_transcription_logic():
+def test_transcription_logic(punct_restorer):
     """Simulate the exact transcription logic from podscripter.py."""
 
     raw_text = """
@@ -39,25 +41,23 @@ def test_transcription_logic():
     lang_for_punctuation = 'es'
 
     for segment in text_segments:
-        processed_segment = restore_punctuation(segment, lang_for_punctuation)
-        parts = re.split(r'([.!?]+)', processed_segment)
+        processed_segment = punct_restorer(segment, lang_for_punctuation)
 
-        for j in range(0, len(parts), 2):
-            if j < len(parts):
-                sentence_text = parts[j].strip()
-                punctuation = parts[j + 1] if j + 1 < len(parts) else ""
+        for match in _SENTENCE_RE.finditer(processed_segment):
+            sentence_text = match.group(1).strip()
+            punctuation = match.group(2)
 
-                if sentence_text:
-                    full_sentence = sentence_text + punctuation
-                    cleaned = re.sub(r'^[",\s]+', '', full_sentence)
+            if sentence_text:
+                full_sentence = sentence_text + punctuation
+                cleaned = _LEADING_JUNK_RE.sub('', full_sentence)
 
-                    if cleaned and cleaned[0].isalpha():
-                        cleaned = cleaned[0].upper() + cleaned[1:]
+                if cleaned and cleaned[0].isalpha():
+                    cleaned = cleaned[0].upper() + cleaned[1:]
 
-                    if cleaned:
-                        if not cleaned.endswith(('.', '!', '?')):
-                            cleaned += '.'
-                        sentences.append(cleaned)
+                if cleaned:
+                    if not cleaned.endswith(('.', '!', '?')):
+                        cleaned += '.'
+                    sentences.append(cleaned)
 
     assert len(sentences) > 0, "No sentences extracted"
     for sentence in sentences:
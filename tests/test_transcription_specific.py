@@ -7,23 +7,21 @@ import re
 
 import pytest
 
-from conftest import restore_punctuation
-
 pytestmark = pytest.mark.transcription
 
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+(?=[,.!?])")
+
 
 def normalize(text: str) -> str:
-    t = re.sub(r"\s+", " ", text.strip())
-    t = re.sub(r"\s+([,.!?])", r"\1", t)
-    return t
+    return " ".join(_SPACE_BEFORE_PUNCT_RE.sub("", text).split())
 
 
-def test_no_exclamation_plus_period():
-    out = restore_punctuation("Hola a todos bienvenidos a Españolistos", "es")
+def test_no_exclamation_plus_period(punct_restorer):
+    out = punct_restorer("Hola a todos bienvenidos a Españolistos", "es")
     norm = normalize(out)
     assert "!." not in norm, f"Found forbidden sequence '!.': {norm}"
 
 
-def test_greeting_and_question_formatting():
-    out = normalize(restore_punctuation("hola para todos como estan", "es"))
+def test_greeting_and_question_formatting(punct_restorer):
+    out = normalize(punct_restorer("hola para todos como estan", "es"))
     assert out.startswith("Hola para todos, ¿"), out